@@ -21,27 +21,27 @@ How to use:
 """
 
 
-async def add_account_with_cookies(username, cookies):
-    """Add Twitter account with complete cookies to twscrape"""
-
-    api = API()  # Uses default accounts.db
+async def register_account_with_cookies(api, username, cookies):
+    """Replace a Twitter account in the twscrape pool using its cookies"""
 
     # Uses empty placeholders, since the API call still expects them
     password = ""
     email = ""
     email_password = ""
 
-    print(f"\nProcessing account: {username}")
+    # Accounts are registered concurrently, so every line names its account
+    prefix = f"[{username}]"
+    print(f"{prefix} Processing account")
 
     # First, try to delete the existing account if it exists
-    print("Removing old account if it exists...")
+    print(f"{prefix} Removing old account if it exists...")
     try:
         await api.pool.delete_accounts(username)
-        print(f"✓ Removed old account '{username}'")
+        print(f"{prefix} ✓ Removed old account")
     except Exception as e:
-        print(f"  (No old account to remove: {e})")
+        print(f"{prefix}   (No old account to remove: {e})")
 
-    print("\nAdding account with cookies...")
+    print(f"{prefix} Adding account with cookies...")
     await api.pool.add_account(
         username=username,
         password=password,
@@ -49,10 +49,14 @@ async def add_account_with_cookies(username, cookies):
         email_password=email_password,
         cookies=cookies,
     )
-    print(f"✓ Account '{username}' added")
+    print(f"{prefix} ✓ Account added")
+
 
-    # CRITICAL STEP: Login the account to activate it
-    print("\nAttempting to login account...")
+async def finalize_and_report(api):
+    """Login every account in the pool once, then print status for all of them"""
+
+    # CRITICAL STEP: Login the accounts to activate them
+    print("\nAttempting to login accounts...")
     try:
         await api.pool.login_all()
         print("✓ Login process completed")
@@ -71,12 +75,15 @@ async def add_account_with_cookies(username, cookies):
         print(f"Last used:  {acc.get('last_used', 'Never')}")
         print(f"Total req:  {acc['total_req']}")
         print(f"Error:      {acc.get('error_msg', 'None')}")
+        print()
 
-    # Only test if account is active
-    if accounts and accounts[0]["active"]:
-        print("\n" + "=" * 60)
+    # Only test if at least one account is active
+    active = [acc for acc in accounts if acc["active"]]
+    if active:
+        print("=" * 60)
         print("Testing Account:")
         print("=" * 60)
+        username = active[0]["username"]
         try:
             user = await api.user_by_login(username)
             print("✓ SUCCESS! Account is working!")
@@ -88,7 +95,7 @@ async def add_account_with_cookies(username, cookies):
         except Exception as e:
             print(f"✗ ERROR testing account: {e}")
     else:
-        print("\n⚠ Account is not active. Cannot test.")
+        print("⚠ No account is active. Cannot test.")
         print("\nTroubleshooting:")
         print("1. Make sure you have BOTH auth_token AND ct0 cookies")
         print("2. Get fresh cookies from browser (F12 > Application > Cookies)")
@@ -96,21 +103,63 @@ async def add_account_with_cookies(username, cookies):
         print("4. Cookies expire - extract fresh ones if needed")
 
 
-async def add_all_from_file(filepath="accounts.txt"):
-    """Parse username:auth_token:ct0 from file and run login for each"""
+async def add_account_with_cookies(username, cookies, api=None):
+    """Add Twitter account with complete cookies to twscrape"""
+
+    if api is None:
+        api = API()  # Uses default accounts.db
+
+    await register_account_with_cookies(api, username, cookies)
+    await finalize_and_report(api)
+
+
+def parse_accounts_file(filepath="accounts.txt"):
+    """Parse username:auth_token:ct0 lines into (username, cookies) pairs"""
 
     with open(filepath, "r") as f:
         lines = [line.strip() for line in f if line.strip()]
 
     for line in lines:
-        try:
-            username, auth_token, ct0 = line.split(":")
-        except ValueError:
+        if line.count(":") != 2:
             print(f"✗ Skipping malformed line: {line}")
-            continue
 
-        cookies = f"auth_token={auth_token}; ct0={ct0}"
-        await add_account_with_cookies(username, cookies)
+    records = [line.split(":") for line in lines if line.count(":") == 2]
+    return [
+        (username, f"auth_token={auth_token}; ct0={ct0}")
+        for username, auth_token, ct0 in records
+    ]
+
+
+async def add_all_from_file(filepath="accounts.txt", max_concurrency=5):
+    """Parse username:auth_token:ct0 from file, add all accounts, then login once"""
+
+    api = API()  # Shared by every account, uses default accounts.db
+
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _one(username, cookies):
+        async with sem:
+            await register_account_with_cookies(api, username, cookies)
+
+    # One failing account must not stop the others or the final login
+    cookies_list = parse_accounts_file(filepath)
+    results = await asyncio.gather(
+        *[_one(username, cookies) for username, cookies in cookies_list],
+        return_exceptions=True,
+    )
+
+    failed = [
+        (username, result)
+        for (username, _), result in zip(cookies_list, results)
+        if isinstance(result, BaseException)
+    ]
+    if failed:
+        print(f"\n✗ {len(failed)} of {len(cookies_list)} account(s) not added:")
+        for username, error in failed:
+            print(f"  [{username}] {error}")
+
+    # login_all walks the whole pool, so it runs once rather than per account
+    await finalize_and_report(api)
 
 
 if __name__ == "__main__":